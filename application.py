@@ -110,7 +110,8 @@ async def research(data: ResearchRequest):
 async def process_research(job_id: str, data: ResearchRequest):
     try:
         if mongodb:
-            mongodb.create_job(job_id, data.dict())
+            # PyMongo is blocking; keep it off the event loop
+            await asyncio.to_thread(mongodb.create_job, job_id, data.dict())
         await asyncio.sleep(1)  # Allow WebSocket connection
 
         await manager.send_status_update(job_id, status="processing", message="Starting research")
@@ -127,6 +128,10 @@ async def process_research(job_id: str, data: ResearchRequest):
         state = {}
         async for s in graph.run(thread={}):
             state.update(s)
+            # Keep the persisted job fresh as the graph progresses; these
+            # per-step writes are coalesced by the 50 ms batcher
+            if mongodb:
+                mongodb.queue_update(job_id, status="processing")
             print(f"Current state for job {job_id}: {state}")
             print(f"State keys: {list(state.keys())}")
             print("\n" * 15)
@@ -156,8 +161,8 @@ async def process_research(job_id: str, data: ResearchRequest):
             })
 
             if mongodb:
-                mongodb.update_job(job_id=job_id, status="completed")
-                mongodb.store_report(job_id=job_id, report_data={
+                await asyncio.to_thread(mongodb.update_job, job_id=job_id, status="completed")
+                await asyncio.to_thread(mongodb.store_report, job_id=job_id, report_data={
                     "report": report_content,
                     "enrichmentCounts": enrichment_counts,
                     "employeeCount": employee_count_info
@@ -199,7 +204,7 @@ async def process_research(job_id: str, data: ResearchRequest):
             error=str(e)
         )
         if mongodb:
-            mongodb.update_job(job_id=job_id, status="failed", error=str(e))
+            await asyncio.to_thread(mongodb.update_job, job_id=job_id, status="failed", error=str(e))
 
 @app.get("/")
 async def ping():
@@ -251,7 +256,7 @@ async def get_research(job_id: str):
             return job_status[job_id]
         raise HTTPException(status_code=404, detail="Research job not found")
 
-    job = mongodb.get_job(job_id)
+    job = await asyncio.to_thread(mongodb.get_job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Research job not found")
     return job
@@ -268,7 +273,7 @@ async def get_research_report(job_id: str):
                     "employeeCount": result.get("employeeCount")
                 }
         raise HTTPException(status_code=404, detail="Report not found")
-    report = mongodb.get_report(job_id)
+    report = await asyncio.to_thread(mongodb.get_report, job_id)
     if not report:
         raise HTTPException(status_code=404, detail="Research report not found")
     return report
@@ -293,4 +298,10 @@ async def generate_pdf(data: PDFGenerationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
+    # Use uvloop for the asyncio event loop where available (Linux/macOS)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     uvicorn.run(app, host="0.0.0.0", port=8000)
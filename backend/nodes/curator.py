@@ -1,4 +1,9 @@
+import asyncio
 import logging
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Dict
 from urllib.parse import urljoin, urlparse
 
@@ -10,12 +15,75 @@ from ..utils.references import process_references_from_search_results
 
 logger = logging.getLogger(__name__)
 
+# Minimum Tavily score a document must reach to be kept. Shared with the
+# researchers so low-score results can be dropped at the search layer instead
+# of travelling all the way to curation.
+DEFAULT_RELEVANCE_THRESHOLD = 0.4
+
+
+def _coerce_employee_count(value) -> int | None:
+    """
+    Coerce a raw employee-count value to an int within the reasonable range
+    (1 to 10 million employees); returns None when invalid or out of range.
+    """
+    if not isinstance(value, (int, float)):
+        return None
+    clean = int(value)
+    if 0 < clean <= 10_000_000:
+        return clean
+    return None
+
+
+def _validate_counts(counts: Dict) -> tuple:
+    """
+    Validate raw employee counts in one pass, returning the valid entries and
+    their running total as (valid_counts, total).
+    """
+    valid_counts = {}
+    total = 0
+    for url, count in counts.items():
+        clean_count = _coerce_employee_count(count)
+        if clean_count is not None:
+            valid_counts[url] = clean_count
+            total += clean_count
+        elif isinstance(count, (int, float)) and count > 0:
+            logger.warning("Employee count %s outside reasonable range for %s", int(count), url)
+    return valid_counts, total
+
+
+@lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """Normalize a URL to its canonical form (scheme added, query/fragment stripped)."""
+    parsed = urlparse(url)
+    if not parsed.scheme:
+        parsed = urlparse(urljoin('https://', url))
+    return parsed._replace(query='', fragment='').geturl()
+
 
 class Curator:
-    def __init__(self) -> None:
-        self.relevance_threshold = 0.4
+    def __init__(self, relevance_threshold: float = DEFAULT_RELEVANCE_THRESHOLD) -> None:
+        self.relevance_threshold = relevance_threshold
+        self.kept_update_batch_size = 50  # Flush kept-doc updates every N docs to bound memory
+        # Memoization of build_enrichment_counts (hit when run()'s error path
+        # rebuilds counts for unchanged state)
+        self._last_enrichment_sig = None
+        self._last_enrichment_counts = None
         logger.info(f"Curator initialized with relevance threshold: {self.relevance_threshold}")
 
+    async def _flush_kept_updates(self, websocket_manager, job_id, kept_updates: list):
+        """Send accumulated kept-document payloads as a single batched update."""
+        if not (websocket_manager and job_id and kept_updates):
+            return
+        await websocket_manager.send_status_update(
+            job_id=job_id,
+            status="document_kept_batch",
+            message=f"Kept {len(kept_updates)} documents",
+            result={
+                "step": "Curation",
+                "items": kept_updates
+            }
+        )
+
     async def evaluate_documents(self, state: ResearchState, docs: list, context: Dict[str, str]) -> list:
         """
         Enhanced document evaluation with better WebSocket updates and error handling.
@@ -36,119 +104,141 @@ class Curator:
         
         logger.info(f"Evaluating {len(docs)} documents")
         evaluated_docs = []
-        
+        kept_updates = []
+        websocket_manager = state.get('websocket_manager')
+        job_id = state.get('job_id')
+
+        # Specialize the loop: bind the threshold, the static reason suffix and
+        # the append targets once instead of resolving them per document
+        threshold = self.relevance_threshold
+        reason_suffix = f" meets threshold {threshold}"
+        keep_doc = evaluated_docs.append
+        queue_update = kept_updates.append
+
         try:
             for doc in docs:
                 try:
                     tavily_score = float(doc.get('score', 0))
-                    if tavily_score >= self.relevance_threshold:
-                        logger.info(f"Document passed threshold with score {tavily_score:.4f} for '{doc.get('title', 'No title')}'")
-                        evaluated_doc = {
-                            **doc,
-                            "evaluation": {
-                                "overall_score": tavily_score,
-                                "query": doc.get('query', ''),
-                                "relevance_reason": f"Score {tavily_score:.4f} meets threshold {self.relevance_threshold}"
-                            }
-                        }
-                        evaluated_docs.append(evaluated_doc)
-                        
-                        # Send WebSocket update for kept documents
-                        if websocket_manager := state.get('websocket_manager'):
-                            if job_id := state.get('job_id'):
-                                await websocket_manager.send_status_update(
-                                    job_id=job_id,
-                                    status="document_kept",
-                                    message=f"Kept document: {doc.get('title', 'No title')}",
-                                    result={
-                                        "step": "Curation",
-                                        "doc_type": doc.get('doc_type', 'unknown'),
-                                        "title": doc.get('title', 'No title'),
-                                        "score": tavily_score,
-                                        "url": doc.get('url', '')
-                                    }
-                                )
-                    else:
-                        logger.info(f"Document below threshold with score {tavily_score:.4f} for '{doc.get('title', 'No title')}'")
                 except (ValueError, TypeError) as e:
-                    logger.warning(f"Error processing score for document '{doc.get('title', 'Unknown')}': {e}")
+                    logger.warning("Error processing score for document %r: %s", doc.get('title', 'Unknown'), e)
+                    continue
+
+                title = doc.get('title', 'No title')
+
+                if tavily_score < threshold:
+                    logger.info("Document below threshold with score %.4f for %r", tavily_score, title)
                     continue
+
+                logger.info("Document passed threshold with score %.4f for %r", tavily_score, title)
+                # Attach the evaluation in place rather than copying the doc
+                doc['evaluation'] = {
+                    "overall_score": tavily_score,
+                    "query": doc.get('query', ''),
+                    "relevance_reason": f"Score {tavily_score:.4f}{reason_suffix}"
+                }
+                # Top-level copy of the score so sorts can use a C-implemented key
+                doc['_sort_key'] = tavily_score
+                keep_doc(doc)
+
+                # Accumulate kept-doc payloads; flushed as one batched update
+                queue_update({
+                    "doc_type": doc.get('doc_type', 'unknown'),
+                    "title": title,
+                    "score": tavily_score,
+                    "url": doc.get('url', '')
+                })
+                if len(kept_updates) >= self.kept_update_batch_size:
+                    await self._flush_kept_updates(websocket_manager, job_id, kept_updates)
+                    kept_updates.clear()
         except Exception as e:
             logger.error(f"Error during document evaluation: {e}")
             return []
+
+        # Flush any remaining kept-doc updates in a single frame
+        await self._flush_kept_updates(websocket_manager, job_id, kept_updates)
         
-        # Sort by score in descending order
-        evaluated_docs.sort(key=lambda x: float(x['evaluation']['overall_score']), reverse=True)
+        # Sort by score in descending order (scores are already floats),
+        # then drop the scratch key so it doesn't leak into curated state
+        evaluated_docs.sort(key=itemgetter('_sort_key'), reverse=True)
+        for doc in evaluated_docs:
+            del doc['_sort_key']
         logger.info(f"Returning {len(evaluated_docs)} evaluated documents")
         return evaluated_docs
 
-    def _extract_employee_count_from_company_data(self, company_data: Dict) -> Dict[str, int]:
+    def _extract_employee_count_from_company_data(self, company_data: Dict) -> tuple:
         """
-        Extract employee count from company data as a fallback mechanism.
+        Extract employee counts from company data as a fallback mechanism,
+        returning (valid_counts, total) accumulated in a single pass.
         """
         valid_employee_counts = {}
-        
+        total_employee_count = 0
+
         for url, data in company_data.items():
             if isinstance(data, dict):
                 # Check for employee_count field
                 if 'employee_count' in data:
                     emp_count = data['employee_count']
-                    if isinstance(emp_count, (int, float)) and emp_count > 0:
-                        clean_count = int(emp_count)
-                        if 1 <= clean_count <= 10000000:
-                            valid_employee_counts[url] = clean_count
-                            logger.info(f"CURATION DEBUG - Extracted employee count from company_data: {clean_count} for {url}")
-                        else:
-                            logger.warning(f"CURATION DEBUG - Employee count {clean_count} outside reasonable range for {url}")
+                    clean_count = _coerce_employee_count(emp_count)
+                    if clean_count is not None:
+                        valid_employee_counts[url] = clean_count
+                        total_employee_count += clean_count
+                        logger.info("CURATION DEBUG - Extracted employee count from company_data: %s for %s", clean_count, url)
                     else:
-                        logger.warning(f"CURATION DEBUG - Invalid employee count in company_data: {emp_count} for {url}")
-        
-        return valid_employee_counts
+                        logger.warning("CURATION DEBUG - Invalid employee count in company_data: %s for %s", emp_count, url)
+
+        return valid_employee_counts, total_employee_count
 
     def build_enrichment_counts(self, state: ResearchState) -> Dict[str, Dict[str, int]]:
         """
         Enhanced enrichment counts builder with robust employee count handling.
         """
         company_data = state.get('company_data', {})
-        
+
         # Get employee count from state (set by company analyzer)
         employee_count_dict = state.get('employee_count', {})
         company_count = state.get('Company_Count', 0)
+
+        # Cheap signature over the inputs; skip the rebuild when nothing changed
+        # since the last invocation (e.g. the error path in run())
+        sig = (
+            id(company_data),
+            len(company_data),
+            len(state.get('curated_company_data', {})),
+            len(state.get('curated_industry_data', {})),
+            len(state.get('curated_financial_data', {})),
+            len(state.get('curated_news_data', {})),
+            tuple(sorted(employee_count_dict.items()))
+        )
+        if sig == self._last_enrichment_sig:
+            logger.info("CURATION DEBUG - Enrichment counts unchanged, returning cached result")
+            return self._last_enrichment_counts
         
-        logger.info(f"CURATION DEBUG - Building enrichment counts:")
-        logger.info(f"CURATION DEBUG - Employee count dict: {employee_count_dict}")
-        logger.info(f"CURATION DEBUG - Company count: {company_count}")
-        logger.info(f"CURATION DEBUG - Company data keys: {list(company_data.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("CURATION DEBUG - Building enrichment counts:")
+            logger.info("CURATION DEBUG - Employee count dict: %s", employee_count_dict)
+            logger.info("CURATION DEBUG - Company count: %s", company_count)
+            logger.info("CURATION DEBUG - Company data keys: %s", list(company_data.keys()))
         # Enhanced validation and processing of employee count data
         valid_employee_counts = {}
         total_employee_count = 0
         
         if employee_count_dict:
             # Filter for valid employee counts with better validation
-            for url, count in employee_count_dict.items():
-                if isinstance(count, (int, float)) and count > 0:
-                    clean_count = int(count)
-                    # Validate reasonable range (1 to 10 million employees)
-                    if 1 <= clean_count <= 10000000:
-                        valid_employee_counts[url] = clean_count
-                        total_employee_count += clean_count
-                    else:
-                        logger.warning(f"Employee count {clean_count} outside reasonable range for {url}")
-            
-            logger.info(f"CURATION DEBUG - Valid employee counts: {valid_employee_counts}")
-            logger.info(f"CURATION DEBUG - Total employee count: {total_employee_count}")
+            valid_employee_counts, total_employee_count = _validate_counts(employee_count_dict)
+
+            logger.info("CURATION DEBUG - Valid employee counts: %s", valid_employee_counts)
+            logger.info("CURATION DEBUG - Total employee count: %s", total_employee_count)
         
         # Fallback: extract from company_data if state data is missing or invalid
         if not valid_employee_counts and company_data:
             logger.warning("No valid employee counts found in state, attempting to extract from company_data")
-            valid_employee_counts = self._extract_employee_count_from_company_data(company_data)
-            total_employee_count = sum(valid_employee_counts.values())
+            valid_employee_counts, total_employee_count = self._extract_employee_count_from_company_data(company_data)
         
         # Update state with validated values
         if valid_employee_counts:
             state['employee_count'] = valid_employee_counts
             state['Company_Count'] = len(valid_employee_counts)
-            logger.info(f"CURATION DEBUG - Updated state with validated employee counts")
+            logger.info("CURATION DEBUG - Updated state with validated employee counts")
         else:
             # Ensure we have at least some structure even if empty
             logger.warning("CURATION DEBUG - No valid employee count data found, using empty structure")
@@ -183,9 +273,10 @@ class Curator:
             },
         }
         
-        logger.info(f"CURATION DEBUG - Final enrichment counts: {enrichment_counts}")
-        logger.info(f"CURATION DEBUG - Employee count section: {enrichment_counts.get('employeeCount', {})}")
-        print("\n"*2)
+        logger.info("CURATION DEBUG - Final enrichment counts: %s", enrichment_counts)
+        logger.info("CURATION DEBUG - Employee count section: %s", enrichment_counts.get('employeeCount', {}))
+        self._last_enrichment_sig = sig
+        self._last_enrichment_counts = enrichment_counts
         return enrichment_counts
 
     async def _send_enrichment_update(self, state: ResearchState, enrichment_counts: Dict):
@@ -204,9 +295,7 @@ class Curator:
                     result={
                         "step": "Enrichment Update",
                         "enrichmentCounts": enrichment_counts,
-                        "timestamp": logger.handlers[0].formatter.formatTime(
-                            logger.handlers[0].formatter.converter(None)
-                        ) if logger.handlers else None
+                        "timestamp": datetime.now().isoformat()
                     }
                 )
                 logger.info("Successfully sent enrichment counts update via WebSocket")
@@ -217,27 +306,29 @@ class Curator:
         """
         Preserve critical state data that should not be lost during curation.
         """
+        # Hold references only - _restore_critical_state_data just reads these,
+        # so defensive copies would be wasted allocations
         preserved_data = {
-            'employee_count': dict(state.get('employee_count', {})),
+            'employee_count': state.get('employee_count', {}),
             'Company_Count': state.get('Company_Count', 0),
-            'enrichment_counts': dict(state.get('enrichment_counts', {}))
+            'enrichment_counts': state.get('enrichment_counts', {})
         }
         
-        logger.info(f"CURATION DEBUG - Preserving critical state data: {preserved_data}")
+        logger.info("CURATION DEBUG - Preserving critical state data: %s", preserved_data)
         return preserved_data
 
     def _restore_critical_state_data(self, state: ResearchState, preserved_data: Dict[str, any]):
         """
         Restore critical state data after curation processing.
         """
-        logger.info(f"CURATION DEBUG - Restoring critical state data")
+        logger.info("CURATION DEBUG - Restoring critical state data")
         
         # Restore employee count data
         if preserved_data.get('employee_count'):
             state['employee_count'] = preserved_data['employee_count']
             state['Company_Count'] = preserved_data['Company_Count']
-            logger.info(f"CURATION DEBUG - Restored employee_count: {state['employee_count']}")
-            logger.info(f"CURATION DEBUG - Restored Company_Count: {state['Company_Count']}")
+            logger.info("CURATION DEBUG - Restored employee_count: %s", state['employee_count'])
+            logger.info("CURATION DEBUG - Restored Company_Count: %s", state['Company_Count'])
         
         # Restore enrichment counts if they existed
         if preserved_data.get('enrichment_counts'):
@@ -246,7 +337,92 @@ class Curator:
             if 'employeeCount' in preserved_data['enrichment_counts']:
                 current_counts['employeeCount'] = preserved_data['enrichment_counts']['employeeCount']
                 state['enrichment_counts'] = current_counts
-                logger.info(f"CURATION DEBUG - Restored enrichment counts with employee data")
+                logger.info("CURATION DEBUG - Restored enrichment counts with employee data")
+
+    def _iter_categories(self, state: ResearchState, data_types: Dict):
+        """
+        Yield (data_field, emoji, doc_type, docs) per populated category with
+        canonicalized, deduplicated docs - no intermediate task buffer.
+        """
+        for data_field, (emoji, doc_type) in data_types.items():
+            data = state.get(data_field, {})
+            if not data:
+                logger.info(f"No data found for {data_field}")
+                continue
+
+            unique_docs = {}
+            for url, doc in data.items():
+                try:
+                    clean_url = _canonical_url(url)
+
+                    if clean_url not in unique_docs:
+                        doc['url'] = clean_url
+                        doc['doc_type'] = doc_type
+                        unique_docs[clean_url] = doc
+                except Exception as e:
+                    logger.warning("Error processing URL %s: %s", url, e)
+                    continue
+
+            yield data_field, emoji, doc_type, list(unique_docs.values())
+
+    async def _evaluate_category(self, state: ResearchState, curation_task: tuple, context: Dict[str, str]):
+        """
+        Evaluate a single category's documents; safe to run concurrently per category.
+        Returns (data_field, relevant_docs, doc_count_entry, msg_lines); relevant_docs
+        is None when no documents passed evaluation or evaluation failed.
+        """
+        data_field, emoji, doc_type, docs = curation_task
+        msg_lines = [f"\n{emoji}: Found {len(docs)} documents"]
+
+        try:
+            # Send category start update
+            if websocket_manager := state.get('websocket_manager'):
+                if job_id := state.get('job_id'):
+                    await websocket_manager.send_status_update(
+                        job_id=job_id,
+                        status="category_start",
+                        message=f"Processing {doc_type} documents",
+                        result={
+                            "step": "Curation",
+                            "doc_type": doc_type,
+                            "initial_count": len(docs)
+                        }
+                    )
+
+            # Evaluate documents
+            evaluated_docs = await self.evaluate_documents(state, docs, context)
+        except Exception as e:
+            logger.error(f"Error curating {doc_type} documents: {e}")
+            msg_lines.append("  ⚠️ Error during curation")
+            return data_field, None, {"initial": len(docs), "kept": 0}, msg_lines
+
+        if not evaluated_docs:
+            msg_lines.append("  ⚠️ No relevant documents found")
+            return data_field, None, {"initial": len(docs), "kept": 0}, msg_lines
+
+        # Select the top 30 documents per category; evaluate_documents already
+        # returns docs sorted by score, so a partial selection is sufficient.
+        # Key on the URL carried in each doc - the evaluated list is sorted, so
+        # positional pairing with the original URL list would mismatch.
+        # relevant_docs preserves the sorted insertion order, so the top 30 are
+        # simply the first 30 entries - no re-sort or key callback needed
+        relevant_docs = {doc['url']: doc for doc in evaluated_docs}
+        if len(relevant_docs) > 30:
+            logger.info(f"Limited {doc_type} documents to top 30 out of {len(relevant_docs)}")
+            relevant_docs = dict(islice(relevant_docs.items(), 30))
+        count_entry = {
+            "initial": len(docs),
+            "kept": len(relevant_docs)
+        }
+
+        if relevant_docs:
+            msg_lines.append(f"  ✅ Kept {len(relevant_docs)} relevant documents")
+            logger.info(f"Kept {len(relevant_docs)} documents for {doc_type} with scores above threshold")
+        else:
+            msg_lines.append("  ⚠️ No documents met relevance threshold")
+            logger.info(f"No documents met relevance threshold for {doc_type}")
+
+        return data_field, relevant_docs, count_entry, msg_lines
 
     async def curate_data(self, state: ResearchState) -> ResearchState:
         """
@@ -294,89 +470,23 @@ class Curator:
             'company_data': ('🏢 Company', 'company')
         }
         
-        # Prepare curation tasks
-        curation_tasks = []
-        for data_field, (emoji, doc_type) in data_types.items():
-            data = state.get(data_field, {})
-            if not data:
-                logger.info(f"No data found for {data_field}")
-                continue
-                
-            unique_docs = {}
-            for url, doc in data.items():
-                try:
-                    parsed = urlparse(url)
-                    if not parsed.scheme:
-                        url = urljoin('https://', url)
-                    clean_url = parsed._replace(query='', fragment='').geturl()
-                    
-                    if clean_url not in unique_docs:
-                        doc['url'] = clean_url
-                        doc['doc_type'] = doc_type
-                        unique_docs[clean_url] = doc
-                except Exception as e:
-                    logger.warning(f"Error processing URL {url}: {e}")
-                    continue
-            
-            docs = list(unique_docs.values())
-            curation_tasks.append((data_field, emoji, doc_type, list(unique_docs.keys()), docs))
-        
-        # Process each data type
+        # Evaluate all categories concurrently - they share no mutable state.
+        # _iter_categories feeds the gather directly; _evaluate_category handles
+        # its own failures, so every result carries its category.
         doc_counts = {}
-        for data_field, emoji, doc_type, urls, docs in curation_tasks:
-            msg.append(f"\n{emoji}: Found {len(docs)} documents")
-            
-            # Send category start update
-            if websocket_manager := state.get('websocket_manager'):
-                if job_id := state.get('job_id'):
-                    await websocket_manager.send_status_update(
-                        job_id=job_id,
-                        status="category_start",
-                        message=f"Processing {doc_type} documents",
-                        result={
-                            "step": "Curation",
-                            "doc_type": doc_type,
-                            "initial_count": len(docs)
-                        }
-                    )
-            
-            # Evaluate documents
-            evaluated_docs = await self.evaluate_documents(state, docs, context)
-            
-            if not evaluated_docs:
-                msg.append("  ⚠️ No relevant documents found")
-                doc_counts[data_field] = {"initial": len(docs), "kept": 0}
-                continue
-            
-            # Process and sort relevant documents
-            relevant_docs = {url: doc for url, doc in zip(urls, evaluated_docs)}
-            sorted_items = sorted(
-                relevant_docs.items(), 
-                key=lambda item: item[1]['evaluation']['overall_score'], 
-                reverse=True
-            )
-            
-            # Limit to top 30 documents per category
-            if len(sorted_items) > 30:
-                sorted_items = sorted_items[:30]
-                logger.info(f"Limited {doc_type} documents to top 30 out of {len(relevant_docs)}")
-            
-            relevant_docs = dict(sorted_items)
-            doc_counts[data_field] = {
-                "initial": len(docs),
-                "kept": len(relevant_docs)
-            }
-            
-            if relevant_docs:
-                msg.append(f"  ✅ Kept {len(relevant_docs)} relevant documents")
-                logger.info(f"Kept {len(relevant_docs)} documents for {doc_type} with scores above threshold")
-            else:
-                msg.append("  ⚠️ No documents met relevance threshold")
-                logger.info(f"No documents met relevance threshold for {doc_type}")
-            
+        results = await asyncio.gather(
+            *(self._evaluate_category(state, task, context)
+              for task in self._iter_categories(state, data_types))
+        )
+
+        for data_field, relevant_docs, count_entry, msg_lines in results:
+            msg.extend(msg_lines)
+            doc_counts[data_field] = count_entry
+
             # Store curated data
-            state[f'curated_{data_field}'] = relevant_docs
-        
+            if relevant_docs is not None:
+                state[f'curated_{data_field}'] = relevant_docs
+
         # Restore critical state data after curation processing
         self._restore_critical_state_data(state, preserved_data)
         
@@ -398,15 +508,16 @@ class Curator:
         enrichment_counts = self.build_enrichment_counts(state)
         state['enrichmentCounts'] = enrichment_counts
         
-        logger.info(f"CURATION DEBUG - Final enrichment counts being sent to frontend: {enrichment_counts}")
-        logger.info(f"CURATION DEBUG - Employee count data in final counts: {enrichment_counts.get('employeeCount', {})}")
-        print("\n"*2)
+        logger.info("CURATION DEBUG - Final enrichment counts being sent to frontend: %s", enrichment_counts)
+        logger.info("CURATION DEBUG - Employee count data in final counts: %s", enrichment_counts.get('employeeCount', {}))
         # Update messages
         messages = state.get('messages', [])
         messages.append(AIMessage(content="\n".join(msg)))
         state['messages'] = messages
 
-        # Send final WebSocket update with complete enrichment counts
+        # Send final WebSocket update with complete enrichment counts.
+        # The enrichment update is folded into this frame rather than sent as a
+        # separate back-to-back enrichment_update message.
         if websocket_manager := state.get('websocket_manager'):
             if job_id := state.get('job_id'):
                 await websocket_manager.send_status_update(
@@ -416,6 +527,7 @@ class Curator:
                     result={
                         "step": "Curation Complete",
                         "enrichmentCounts": enrichment_counts,
+                        "timestamp": datetime.now().isoformat(),
                         "doc_counts": {
                             "company": doc_counts.get('company_data', {"initial": 0, "kept": 0}),
                             "industry": doc_counts.get('industry_data', {"initial": 0, "kept": 0}),
@@ -433,10 +545,7 @@ class Curator:
                         }
                     }
                 )
-        
-        # Send additional enrichment update
-        await self._send_enrichment_update(state, enrichment_counts)
-        
+
         logger.info(f"Curation complete for {company}. Total documents curated: {sum(counts.get('kept', 0) for counts in doc_counts.values())}")
         return state
 
@@ -457,5 +566,6 @@ class Curator:
             # Build minimal enrichment counts for error case
             enrichment_counts = self.build_enrichment_counts(state)
             state['enrichmentCounts'] = enrichment_counts
-            
+            await self._send_enrichment_update(state, enrichment_counts)
+
             return state
\ No newline at end of file
@@ -9,19 +9,30 @@ from tavily import AsyncTavilyClient
 
 from ...classes import ResearchState
 from ...utils.references import clean_title
+from ..curator import DEFAULT_RELEVANCE_THRESHOLD
 logger = logging.getLogger(__name__)
 
 class BaseResearcher:
     def __init__(self):
         tavily_key = os.getenv("TAVILY_API_KEY")
         openai_key = os.getenv("OPENAI_API_KEY")
-        
+
         if not tavily_key or not openai_key:
             raise ValueError("Missing API keys")
-            
+
         self.tavily_client = AsyncTavilyClient(api_key=tavily_key)
         self.openai_client = AsyncOpenAI(api_key=openai_key)
         self.analyst_type = "base_researcher"  # Default type
+        # Tavily's search API has no server-side min_score, so drop documents
+        # the Curator would reject as soon as results arrive
+        self.min_relevance_score = DEFAULT_RELEVANCE_THRESHOLD
+        # Bounds concurrent per-query searches so fan-out respects Tavily rate limits
+        self._search_semaphore = asyncio.Semaphore(8)
+
+    async def _bounded_search(self, state: ResearchState, query: str) -> Dict[str, Any]:
+        """Run a single-query search under the shared concurrency bound."""
+        async with self._search_semaphore:
+            return await self.search_documents(state, [query])
 
     @property
     def analyst_type(self) -> str:
@@ -206,7 +217,9 @@ class BaseResearcher:
             for result in results.get("results", []):
                 if not result.get("content") or not result.get("url"):
                     continue
-                    
+                if result.get("score", 0.0) < self.min_relevance_score:
+                    continue
+
                 url = result.get("url")
                 title = result.get("title", "")
                 
@@ -323,7 +336,9 @@ class BaseResearcher:
             for item in result.get("results", []):
                 if not item.get("content") or not item.get("url"):
                     continue
-                    
+                if item.get("score", 0.0) < self.min_relevance_score:
+                    continue
+
                 url = item.get("url")
                 title = item.get("title", "")
                 
@@ -11,61 +11,144 @@ import asyncio
 import re
 import logging
 
+# Configure Gemini once at import - re-reading .env and mutating os.environ
+# per analyzer instantiation was wasted file I/O on every job
+load_dotenv()
+_GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+if _GEMINI_API_KEY:
+    genai.configure(api_key=_GEMINI_API_KEY)
+
+# Compiled once - these run per company lookup
+_NUM_RE = re.compile(r"(\d[\d,]*)")
+
+# Headcount statements companies put on their own sites ("over 1,200
+# employees", "500 staff"). When the scrape already says it, the Gemini
+# round-trip can be skipped entirely.
+_HEADCOUNT_RE = re.compile(
+    r"(\d[\d,]{1,9})\s+(?:employees|staff|people|team members)",
+    re.IGNORECASE
+)
+
+# Deletion table that strips every non-digit character in one C-level pass;
+# far cheaper than the regex engine on the short strings Gemini returns
+_STRIP_NON_DIGITS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if chr(c) not in '0123456789'
+))
+
+# Static few-shot portion of the employee-count prompt. Built once at import;
+# per call we only append the short company-specific question instead of
+# re-concatenating ~20 string literals
+_PROMPT_PREFIX = (
+    "You are a business data analyst. Your job is to provide the most recent employee count for a company.\n"
+    "- If you know the number, respond with only the number (no words, no formatting, no commas).\n"
+    "- If you do not know, respond with your best approximation based on company size and industry.\n"
+    "- If you know the year, append it in parentheses, e.g., 1200 (2023).\n"
+    "- For small companies or startups, estimate between 10-100.\n"
+    "- For medium companies, estimate between 100-1000.\n"
+    "- For large corporations, estimate between 1000-100000+.\n"
+    "\n"
+    "Examples:\n"
+    "Q: What is the most recent employee count for 'Google'?\n"
+    "A: 182502 (2023)\n"
+    "\n"
+    "Q: What is the most recent employee count for 'Acme Widgets'?\n"
+    "A: 150\n"
+    "\n"
+    "Q: What is the most recent employee count for 'Tesla'?\n"
+    "A: 140473 (2023)\n"
+    "\n"
+)
+
+# In-process cache of employee counts keyed on normalized (company, industry).
+# A second alias key - token-sorted with corporate suffixes dropped - lets
+# near-identical names ("Acme Widgets Inc." vs "acme widgets") hit the same
+# entry without another LLM round-trip. Bounded with FIFO eviction so a
+# long-lived process cannot grow it indefinitely.
+_employee_count_cache: dict = {}
+_EMPLOYEE_COUNT_CACHE_MAX = 4096
+
+# Legal-form suffixes that don't distinguish one company from another
+_CORP_SUFFIXES = frozenset({
+    "inc", "incorporated", "ltd", "limited", "llc", "corp", "corporation", "co"
+})
+
+
+def _employee_count_cache_keys(company: str, industry: str = None) -> tuple:
+    company_key = company.lower().strip()
+    industry_key = (industry or "").lower().strip()
+    tokens = company_key.replace(".", "").replace(",", "").split()
+    core_tokens = [token for token in tokens if token not in _CORP_SUFFIXES] or tokens
+    fuzzy_key = "".join(sorted(core_tokens))
+    return (company_key, industry_key), (fuzzy_key, industry_key)
+
+
+def _cache_employee_count(exact_key: tuple, fuzzy_key: tuple, count: str) -> None:
+    while len(_employee_count_cache) >= _EMPLOYEE_COUNT_CACHE_MAX:
+        _employee_count_cache.pop(next(iter(_employee_count_cache)))
+    _employee_count_cache[exact_key] = count
+    _employee_count_cache[fuzzy_key] = count
+
+
+# Buckets mirrored to the UI's docCounts panel
+_ENRICHMENT_BUCKETS = ("company", "employeeCount", "industry", "financial", "news")
+
+
+def _bump(state: ResearchState, bucket: str, enriched: int = 1, total: int = None) -> None:
+    """
+    Adjust the running enrichment counters in place. Counting at each
+    document-insert site keeps state['enrichment_counts'] current for O(1)
+    per document, instead of re-scanning every data dict per status update.
+    """
+    counts = state.setdefault('enrichment_counts', {})
+    if not counts:
+        for name in _ENRICHMENT_BUCKETS:
+            counts[name] = {"enriched": 0, "total": 0}
+    entry = counts.setdefault(bucket, {"enriched": 0, "total": 0})
+    entry["enriched"] += enriched
+    entry["total"] += enriched if total is None else total
+
+
 class CompanyAnalyzer(BaseResearcher):
     def __init__(self) -> None:
         super().__init__()
         self.analyst_type = "company_analyzer"
-        self._configure_gemini()
-
-    def _configure_gemini(self):
-        load_dotenv()
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
+        if not _GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY not found in environment variables or .env file.")
-        genai.configure(api_key=api_key)
+        # Reuse one model instance instead of constructing it per call
+        self._model = genai.GenerativeModel('gemini-1.5-flash')
 
     async def get_employee_count_via_llm(self, company: str, industry: str = None) -> str:
         """
         Enhanced employee count retrieval with better error handling and validation.
         """
+        exact_key, fuzzy_key = _employee_count_cache_keys(company, industry)
+        cached = _employee_count_cache.get(exact_key) or _employee_count_cache.get(fuzzy_key)
+        if cached is not None:
+            logging.info(f"Employee count cache hit for {company}: {cached}")
+            return cached
+
         prompt = (
-            "You are a business data analyst. Your job is to provide the most recent employee count for a company.\n"
-            "- If you know the number, respond with only the number (no words, no formatting, no commas).\n"
-            "- If you do not know, respond with your best approximation based on company size and industry.\n"
-            "- If you know the year, append it in parentheses, e.g., 1200 (2023).\n"
-            "- For small companies or startups, estimate between 10-100.\n"
-            "- For medium companies, estimate between 100-1000.\n"
-            "- For large corporations, estimate between 1000-100000+.\n"
-            "\n"
-            "Examples:\n"
-            "Q: What is the most recent employee count for 'Google'?\n"
-            "A: 182502 (2023)\n"
-            "\n"
-            "Q: What is the most recent employee count for 'Acme Widgets'?\n"
-            "A: 150\n"
-            "\n"
-            "Q: What is the most recent employee count for 'Tesla'?\n"
-            "A: 140473 (2023)\n"
-            "\n"
-            f"Now answer:\nQ: What is the most recent employee count for '{company}'"
+            _PROMPT_PREFIX
+            + f"Now answer:\nQ: What is the most recent employee count for '{company}'"
             + (f" in the {industry} industry" if industry else "")
             + "?\nA:"
         )
 
         try:
-            def call_gemini():
-                model = genai.GenerativeModel('gemini-1.5-flash')
-                response = model.generate_content(prompt)
-                return response.text.strip()
+            # The SDK's native async call shares the event loop directly -
+            # no executor hop needed for what is pure network I/O
+            response = await self._model.generate_content_async(prompt)
+            result = response.text.strip()
             
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, call_gemini)
-            
-            # Enhanced parsing to extract employee count
-            match = re.search(r"(\d[\d,]*)", result)
-            if match:
-                clean_count = match.group(1).replace(",", "")
+            # Enhanced parsing to extract employee count. Fast path: replies
+            # usually start with the bare number, so skip the regex entirely
+            head = result.split('(', 1)[0].strip().replace(',', '')
+            match = None if head.isdigit() else _NUM_RE.search(result)
+            if head.isdigit() or match:
+                clean_count = head if head.isdigit() else match.group(1).replace(",", "")
                 logging.info(f"Successfully extracted employee count duriing api call in company.py: {clean_count} for {company}")
+                # Cache successful lookups only - fallbacks should retry next time
+                _cache_employee_count(exact_key, fuzzy_key, clean_count)
                 return clean_count
             else:
                 logging.warning(f"Could not parse employee count from Gemini response: {result}")
@@ -81,7 +164,7 @@ class CompanyAnalyzer(BaseResearcher):
         """
         try:
             # Remove any non-digit characters except for parentheses content
-            clean_count = re.sub(r'[^\d]', '', raw_count.split('(')[0].strip())
+            clean_count = raw_count.split('(', 1)[0].translate(_STRIP_NON_DIGITS)
             
             if clean_count:
                 employee_count = int(clean_count)
@@ -122,8 +205,8 @@ class CompanyAnalyzer(BaseResearcher):
                 
                 # Update state with new enrichment counts
                 state['enrichment_counts'] = current_enrichment_counts
-                
-                await websocket_manager.send_status_update(
+
+                websocket_manager.queue_status_update(
                     job_id=job_id,
                     status="employee_count_ready",
                     message=f"Employee count determined: {employee_count:,}",
@@ -140,7 +223,7 @@ class CompanyAnalyzer(BaseResearcher):
                         }
                     }
                 )
-                logging.info(f"Sent employee count WebSocket update: {employee_count} for {company}")
+                logging.info(f"Queued employee count WebSocket update: {employee_count} for {company}")
             except Exception as e:
                 logging.error(f"Error sending employee count WebSocket update: {e}")
 
@@ -153,33 +236,14 @@ class CompanyAnalyzer(BaseResearcher):
         
         if websocket_manager and job_id:
             try:
-                # Build comprehensive enrichment counts
-                enrichment_counts = {
-                    "company": {
-                        "enriched": len(state.get('company_data', {})),
-                        "total": state.get('Company_Count', 0) + len(state.get('company_data', {}))
-                    },
-                    "employeeCount": {
-                        "enriched": next(iter(state.get('employee_count', {None: 0}).values())),
-                        "total": 1
-                    },
-                    "industry": {
-                        "enriched": len(state.get('industry_data', {})),
-                        "total": len(state.get('industry_data', {}))
-                    },
-                    "financial": {
-                        "enriched": len(state.get('financial_data', {})),
-                        "total": len(state.get('financial_data', {}))
-                    },
-                    "news": {
-                        "enriched": len(state.get('news_data', {})),
-                        "total": len(state.get('news_data', {}))
-                    }
-                }
-                
-                state['enrichment_counts'] = enrichment_counts
-                
-                await websocket_manager.send_status_update(
+                # Counters are maintained incrementally via _bump at every
+                # document-insert site, so this is just a push of current state
+                enrichment_counts = state.get('enrichment_counts')
+                if not enrichment_counts:
+                    _bump(state, 'company', 0)
+                    enrichment_counts = state['enrichment_counts']
+
+                websocket_manager.queue_status_update(
                     job_id=job_id,
                     status="enrichment_counts_updated",
                     message="Enrichment counts updated",
@@ -210,15 +274,18 @@ class CompanyAnalyzer(BaseResearcher):
         """)
 
         subqueries_msg = "🔍 Subqueries for company analysis:\n" + "\n".join([f"• {query}" for query in queries])
-        messages = state.get('messages', [])
+        # setdefault binds the in-state list once; appends below mutate it in
+        # place, so no re-fetch or write-back is needed
+        messages = state.setdefault('messages', [])
         messages.append(AIMessage(content=subqueries_msg))
-        state['messages'] = messages
+        employee_counts = state.setdefault('employee_count', {})
 
-        # Send initial WebSocket update
+        # Queue initial WebSocket update; flushed together with the
+        # employee-count loading state below
         websocket_manager = state.get('websocket_manager')
         job_id = state.get('job_id')
         if websocket_manager and job_id:
-            await websocket_manager.send_status_update(
+            websocket_manager.queue_status_update(
                 job_id=job_id,
                 status="processing",
                 message="Company analysis queries generated",
@@ -242,14 +309,16 @@ class CompanyAnalyzer(BaseResearcher):
                 'raw_content': site_scrape,
                 'query': f'Company overview and information about {company}'
             }
+            _bump(state, 'company')
 
         # Enhanced employee count extraction - MOVED TO BEGINNING FOR IMMEDIATE UI UPDATE
         try:
             msg.append(f"\n👥 Analyzing employee count for {company}...")
             
-            # Send loading state update for employee count
+            # Queue loading state update for employee count and flush the
+            # batch before the LLM round-trip so the UI shows progress
             if websocket_manager and job_id:
-                await websocket_manager.send_status_update(
+                websocket_manager.queue_status_update(
                     job_id=job_id,
                     status="processing",
                     message="Analyzing employee count...",
@@ -265,8 +334,18 @@ class CompanyAnalyzer(BaseResearcher):
                         }
                     }
                 )
-            
-            employee_count_raw = await self.get_employee_count_via_llm(company, industry)
+                await websocket_manager.flush_status_updates(job_id)
+
+
+            # Cheapest source first: the company's own site often states its
+            # headcount, making the LLM call unnecessary
+            scrape_match = _HEADCOUNT_RE.search(site_scrape) if site_scrape else None
+            if scrape_match:
+                employee_count_raw = scrape_match.group(1)
+                logging.info(f"Employee count for {company} extracted from site scrape: {employee_count_raw}")
+            else:
+                employee_count_raw = await self.get_employee_count_via_llm(company, industry)
+                logging.info(f"Employee count for {company} resolved via LLM: {employee_count_raw}")
             employee_count_value = self._validate_and_process_employee_count(employee_count_raw, company)
             
             msg.append(f"👥 Employee count determined: {employee_count_value:,}")
@@ -276,17 +355,17 @@ class CompanyAnalyzer(BaseResearcher):
             company_url = state.get('company_url', company.lower().replace(' ', '-'))
             
             # Update state with employee count information IMMEDIATELY
-            if 'employee_count' not in state:
-                state['employee_count'] = {}
-            state['employee_count'][company_url] = employee_count_value
+            employee_counts[company_url] = employee_count_value
             state['Company_Count'] = 1 if employee_count_value > 0 else 0
+            _bump(state, 'company', 0, total=state['Company_Count'])
             
-            # Send immediate employee count update via WebSocket
+            # Queue employee count + enrichment counts updates and flush them
+            # as one frame for immediate UI delivery
             await self._send_employee_count_update(state, employee_count_value, company)
-            
-            # Update enrichment counts
             await self._send_enrichment_counts_update(state)
-            
+            if websocket_manager and job_id:
+                await websocket_manager.flush_status_updates(job_id)
+
         except Exception as e:
             logging.error(f"Error during employee count analysis for {company}: {e}")
             employee_count_value = 100
@@ -294,13 +373,14 @@ class CompanyAnalyzer(BaseResearcher):
             
             # Still update state with fallback value
             company_url = state.get('company_url', company.lower().replace(' ', '-'))
-            if 'employee_count' not in state:
-                state['employee_count'] = {}
-            state['employee_count'][company_url] = employee_count_value
+            employee_counts[company_url] = employee_count_value
             state['Company_Count'] = 1
-            
+            _bump(state, 'company', 0, total=1)
+
             # Send fallback update
             await self._send_employee_count_update(state, employee_count_value, company)
+            if websocket_manager and job_id:
+                await websocket_manager.flush_status_updates(job_id)
 
         # Ensure the main company entry exists and update with employee count
         if company_url not in company_data:
@@ -309,6 +389,7 @@ class CompanyAnalyzer(BaseResearcher):
                 'raw_content': site_scrape or "",
                 'query': f'Company overview and information about {company}'
             }
+            _bump(state, 'company')
         
         # Add employee count to company data
         company_data[company_url]['employee_count'] = employee_count_value
@@ -317,30 +398,36 @@ class CompanyAnalyzer(BaseResearcher):
         try:
             msg.append(f"\n🔍 Searching for additional company documents...")
             
-            for i, query in enumerate(queries):
-                try:
-                    documents = await self.search_documents(state, [query])
-                    if documents:
-                        for url, doc in documents.items():
-                            doc['query'] = query
-                            doc['query_index'] = i
-                            company_data[url] = doc
-                        msg.append(f"  ✓ Query {i+1}: Found {len(documents)} documents")
-                    else:
-                        msg.append(f"  • Query {i+1}: No documents found")
-                        
-                except Exception as e:
-                    logging.error(f"Error searching for query '{query}': {e}")
+            # Fan out the searches concurrently - each query is independent I/O
+            results = await asyncio.gather(
+                *(self._bounded_search(state, query) for query in queries),
+                return_exceptions=True
+            )
+
+            for i, (query, documents) in enumerate(zip(queries, results)):
+                if isinstance(documents, Exception):
+                    logging.error(f"Error searching for query '{query}': {documents}")
                     msg.append(f"  ⚠️ Query {i+1}: Search error")
+                elif documents:
+                    for url, doc in documents.items():
+                        doc['query'] = query
+                        doc['query_index'] = i
+                        if url not in company_data:
+                            _bump(state, 'company')
+                        company_data[url] = doc
+                    msg.append(f"  ✓ Query {i+1}: Found {len(documents)} documents")
+                else:
+                    msg.append(f"  • Query {i+1}: No documents found")
 
             msg.append(f"\n✅ Company analysis complete: {len(company_data)} total documents")
             
-            # Send final comprehensive WebSocket update
+            # Queue final comprehensive WebSocket update; flushed with the
+            # enrichment counts as one frame
             if websocket_manager and job_id:
                 # Final enrichment counts update
                 await self._send_enrichment_counts_update(state)
-                
-                await websocket_manager.send_status_update(
+
+                websocket_manager.queue_status_update(
                     job_id=job_id,
                     status="company_analysis_complete",
                     message=f"Company analysis complete. Found {len(company_data)} documents",
@@ -348,7 +435,7 @@ class CompanyAnalyzer(BaseResearcher):
                         "step": "Company Analysis Complete",
                         "analyst_type": "Company Analyst",
                         "queries": queries,
-                        "employee_count": state.get('employee_count', {}),
+                        "employee_count": employee_counts,
                         "company_count": state.get('Company_Count', 0),
                         "documents_found": len(company_data),
                         "enrichmentCounts": state.get('enrichment_counts', {}),
@@ -365,22 +452,24 @@ class CompanyAnalyzer(BaseResearcher):
             msg.append(f"\n⚠️ Error during document search: {str(e)}")
             logging.error(f"Error during company document search: {e}")
 
+        # Deliver anything still queued as a single batched frame
+        if websocket_manager and job_id:
+            await websocket_manager.flush_status_updates(job_id)
+
         # Update messages with final status
-        messages = state.get('messages', [])
         messages.append(AIMessage(content="\n".join(msg)))
-        state['messages'] = messages
         state['company_data'] = company_data
         
         # Log final state for debugging
         logging.info(f"Company analysis complete for {company}")
-        logging.info(f"Final employee count: {state.get('employee_count')}")
+        logging.info(f"Final employee count: {employee_counts}")
         logging.info(f"Company_Count: {state.get('Company_Count')}")
         logging.info(f"Total documents found: {len(company_data)}")
         logging.info("\n"*10)
         return {
             'messages': messages,
             'company_data': company_data,
-            'employee_count': state.get('employee_count', {}),
+            'employee_count': employee_counts,
             'Company_Count': state.get('Company_Count', 0),
             'enrichment_counts': state.get('enrichment_counts', {})
         }
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict
 
 from langchain_core.messages import AIMessage
@@ -5,6 +6,30 @@ from langchain_core.messages import AIMessage
 from ...classes import ResearchState
 from .base import BaseResearcher
 
+# Keyword -> report bucket, checked in order; first match wins. A flat table
+# scans each query once instead of re-lowering it through an if/elif ladder.
+_BUCKETS = (
+    ("market position", "Market Position"),
+    ("competitor", "Competitors"),
+    ("trend", "Trends and Challenges"),
+    ("challenge", "Trends and Challenges"),
+    ("market size", "Market Size and Growth"),
+    ("growth", "Market Size and Growth"),
+    ("regulatory", "Regulatory Environment"),
+    ("compliance", "Regulatory Environment"),
+    ("supply chain", "Supply Chain"),
+    ("logistics", "Supply Chain"),
+    ("technology", "Technology and Innovation"),
+    ("innovation", "Technology and Innovation"),
+    ("customer", "Customer Segments"),
+    ("segment", "Customer Segments"),
+    ("sustainability", "Sustainability and ESG"),
+    ("esg", "Sustainability and ESG"),
+    ("financial", "Financial Benchmarks"),
+    ("benchmark", "Financial Benchmarks"),
+    ("average", "Financial Benchmarks"),
+)
+
 class IndustryAnalyzer(BaseResearcher):
     def __init__(self) -> None:
         super().__init__()
@@ -31,9 +56,10 @@ class IndustryAnalyzer(BaseResearcher):
         """)
 
         subqueries_msg = "🔍 Subqueries for industry analysis:\n" + "\n".join([f"• {query}" for query in queries])
-        messages = state.get('messages', [])
+        # setdefault binds the in-state list once; later appends mutate it in
+        # place, so no re-fetch or write-back is needed
+        messages = state.setdefault('messages', [])
         messages.append(AIMessage(content=subqueries_msg))
-        state['messages'] = messages
 
         # Send queries through WebSocket
         if websocket_manager := state.get('websocket_manager'):
@@ -69,8 +95,11 @@ class IndustryAnalyzer(BaseResearcher):
 
         # Perform additional research with increased search depth
         try:
-            for query in queries:
-                documents = await self.search_documents(state, [query])
+            # Fan out the searches concurrently - each query is independent I/O
+            results = await asyncio.gather(
+                *(self._bounded_search(state, query) for query in queries)
+            )
+            for query, documents in zip(queries, results):
                 if documents:
                     for url, doc in documents.items():
                         doc['query'] = query
@@ -108,33 +137,11 @@ class IndustryAnalyzer(BaseResearcher):
         }
         for url, doc in industry_data.items():
             query = doc.get('query', '').lower()
-            if "market position" in query:
-                structured_report["Market Position"].append(doc)
-            elif "competitor" in query:
-                structured_report["Competitors"].append(doc)
-            elif "trend" in query or "challenge" in query:
-                structured_report["Trends and Challenges"].append(doc)
-            elif "market size" in query or "growth" in query:
-                structured_report["Market Size and Growth"].append(doc)
-            elif "regulatory" in query or "compliance" in query:
-                structured_report["Regulatory Environment"].append(doc)
-            elif "supply chain" in query or "logistics" in query:
-                structured_report["Supply Chain"].append(doc)
-            elif "technology" in query or "innovation" in query:
-                structured_report["Technology and Innovation"].append(doc)
-            elif "customer" in query or "segment" in query:
-                structured_report["Customer Segments"].append(doc)
-            elif "sustainability" in query or "esg" in query:
-                structured_report["Sustainability and ESG"].append(doc)
-            elif "financial" in query or "benchmark" in query or "average" in query:
-                structured_report["Financial Benchmarks"].append(doc)
-            else:
-                structured_report["Other"].append(doc)
+            bucket = next((b for kw, b in _BUCKETS if kw in query), "Other")
+            structured_report[bucket].append(doc)
 
         # Update state with findings and structured report
-        messages = state.get('messages', [])
         messages.append(AIMessage(content="\n".join(msg)))
-        state['messages'] = messages
         state['industry_data'] = industry_data
         state['industry_report'] = structured_report
 
@@ -1,30 +1,81 @@
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 import certifi
-from pymongo import MongoClient
+import zstandard
+from bson import Binary
+from pymongo import MongoClient, UpdateOne
 
-class MongoDBService:
-    def __init__(self, uri: str):
-        # Use certifi for SSL certificate verification with updated options
-        self.client = MongoClient(
+# Resolved once: certifi.where() walks the filesystem on every call
+_CA_FILE = certifi.where()
+
+# Reports compress roughly 3-4x as markdown prose; shared (thread-safe)
+# compressor/decompressor avoid re-allocating zstd contexts per report.
+# Short reports are stored as-is - compression overhead isn't worth it.
+_REPORT_COMPRESS_MIN_BYTES = 1024
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
+# MongoClient maintains its own connection pool and monitor threads, so one
+# pair per URI is shared process-wide instead of per service instance
+_clients: Dict[str, tuple] = {}
+
+
+def _get_clients(uri: str) -> tuple:
+    clients = _clients.get(uri)
+    if clients is None:
+        # Durable client: report writes wait for majority acknowledgement
+        durable = MongoClient(
             uri,
-            tlsCAFile=certifi.where(),
+            tlsCAFile=_CA_FILE,
             retryWrites=True,
-            w='majority'
+            w='majority',
+            serverSelectionTimeoutMS=3000
         )
+        # Fast client for job-status updates: these are ephemeral pings, so
+        # primary-only acknowledgement avoids waiting on replication RTT.
+        # Wire compression cuts bandwidth when the server supports it.
+        fast = MongoClient(
+            uri,
+            tlsCAFile=_CA_FILE,
+            retryWrites=True,
+            w=1,
+            maxPoolSize=100,
+            compressors='zstd,snappy',
+            serverSelectionTimeoutMS=3000
+        )
+        clients = _clients[uri] = (durable, fast)
+    return clients
+
+
+class MongoDBService:
+    def __init__(self, uri: str):
+        self.client, self.client_fast = _get_clients(uri)
         self.db = self.client.get_database('tavily_research')
         self.jobs = self.db.jobs
         self.reports = self.db.reports
+        self.jobs_fast = self.client_fast.get_database('tavily_research').jobs
+        # Every lookup and update filters on job_id; without these indexes
+        # each one is a full collection scan
+        self.jobs.create_index("job_id", unique=True, background=True)
+        self.reports.create_index("job_id", unique=True, background=True)
+        # Dashboard-style queries: recent jobs by status
+        self.jobs.create_index([("status", 1), ("updated_at", -1)], background=True)
+        # Coalesced job updates awaiting a bulk flush (see queue_update)
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._flush_task = None
+        self._flush_interval = 0.05  # seconds
 
     def create_job(self, job_id: str, inputs: Dict[str, Any]) -> None:
         """Create a new research job record."""
+        now = datetime.now(timezone.utc)
         self.jobs.insert_one({
             "job_id": job_id,
             "inputs": inputs,
             "status": "pending",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         })
 
     def update_job(self, job_id: str, 
@@ -34,7 +85,11 @@ class MongoDBService:
                   enrichmentCounts: Dict[str, Any] = None,
                   employeeCount: Dict[str, Any] = None) -> None:
         """Update a research job with results or status."""
-        update_data = {"updated_at": datetime.utcnow()}
+        # Drop any queued update for this job: a flush firing after this
+        # direct write would otherwise overwrite it with stale fields
+        # (e.g. status "processing" landing on top of "completed")
+        self._pending_updates.pop(job_id, None)
+        update_data = {"updated_at": datetime.now(timezone.utc)}
         if status:
             update_data["status"] = status
         if result:
@@ -46,28 +101,81 @@ class MongoDBService:
         if employeeCount is not None:
             update_data["employeeCount"] = employeeCount
 
-        self.jobs.update_one(
+        # Status updates go through the fast (w=1) client
+        self.jobs_fast.update_one(
             {"job_id": job_id},
             {"$set": update_data}
         )
 
+    def queue_update(self, job_id: str, **fields: Any) -> None:
+        """
+        Coalesce a non-durable job update. Updates queued within the flush
+        window (50 ms) are merged per job - keeping only the latest value for
+        each field - and written in one bulk_write instead of a round-trip per
+        call. Use update_job directly for terminal states that must land now.
+        """
+        merged = self._pending_updates.setdefault(job_id, {})
+        merged.update({k: v for k, v in fields.items() if v is not None})
+        merged["updated_at"] = datetime.now(timezone.utc)
+
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop (sync caller) - write through immediately
+                self._flush_pending()
+                return
+            self._flush_task = loop.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        # Snapshot on the event loop, where queue_update also runs, so no
+        # update can slip into the detached dict mid-swap; only the blocking
+        # bulk_write is pushed to a worker thread
+        pending, self._pending_updates = self._pending_updates, {}
+        if pending:
+            await asyncio.to_thread(self._write_pending, pending)
+
+    def _flush_pending(self) -> None:
+        pending, self._pending_updates = self._pending_updates, {}
+        if pending:
+            self._write_pending(pending)
+
+    def _write_pending(self, pending: Dict[str, Dict[str, Any]]) -> None:
+        self.jobs_fast.bulk_write(
+            [UpdateOne({"job_id": job_id}, {"$set": fields}) for job_id, fields in pending.items()],
+            ordered=False
+        )
+
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a job by ID."""
         return self.jobs.find_one({"job_id": job_id})
 
     def store_report(self, job_id: str, report_data: Dict[str, Any]) -> None:
         """Store the finalized research report."""
+        report_content = report_data.get("report", "")
+        report_encoding = "plain"
+        if len(report_content) >= _REPORT_COMPRESS_MIN_BYTES:
+            report_content = Binary(_zstd_compressor.compress(report_content.encode()))
+            report_encoding = "zstd"
         self.reports.insert_one({
             "job_id": job_id,
-            "report_content": report_data.get("report", ""),
+            "report_content": report_content,
+            "report_encoding": report_encoding,
             "references": report_data.get("references", []),
             "sections": report_data.get("sections_completed", []),
             "analyst_queries": report_data.get("analyst_queries", {}),
             "enrichmentCounts": report_data.get("enrichmentCounts", {}),
             "employeeCount": report_data.get("employeeCount", {}),
-            "created_at": datetime.utcnow()
+            "created_at": datetime.now(timezone.utc)
         })
 
     def get_report(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a report by job ID."""
-        return self.reports.find_one({"job_id": job_id})
+        report = self.reports.find_one({"job_id": job_id})
+        if report and report.get("report_encoding") == "zstd":
+            report["report_content"] = _zstd_decompressor.decompress(
+                report["report_content"]
+            ).decode()
+            report["report_encoding"] = "plain"
+        return report
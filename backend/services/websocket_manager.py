@@ -1,18 +1,25 @@
-import json
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Set
 
+import orjson
 from fastapi import WebSocket
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Broadcasts to more clients than this are sent in chunks, yielding the event
+# loop between chunks so a large fan-out cannot stall other requests
+BROADCAST_CHUNK_SIZE = 50
+
 class WebSocketManager:
     def __init__(self):
         # Store active connections for each job
         self.active_connections: Dict[str, Set[WebSocket]] = {}
-        
+        # Status updates queued per job, awaiting a batched flush
+        self.pending_updates: Dict[str, list] = {}
+
     async def connect(self, websocket: WebSocket, job_id: str):
         """Connect a new client to a specific job."""
         if job_id not in self.active_connections:
@@ -41,21 +48,34 @@ class WebSocketManager:
         # Add timestamp to message
         message["timestamp"] = datetime.now().isoformat()
         
-        # Convert message to JSON string
-        message_str = json.dumps(message)
+        # Convert message to JSON string (orjson is much faster than stdlib json
+        # for the nested status payloads sent here)
+        message_str = orjson.dumps(message).decode()
         logger.info(f"Message content: {message_str}")
         
         # Send to all connected clients for this job
         success_count = 0
         disconnected = set()
-        for connection in self.active_connections[job_id]:
+
+        async def send(connection):
+            nonlocal success_count
             try:
                 await connection.send_text(message_str)
                 success_count += 1
             except Exception as e:
                 logger.error(f"Error sending message to client: {str(e)}", exc_info=True)
                 disconnected.add(connection)
-        
+
+        connections = list(self.active_connections[job_id])
+        if len(connections) <= BROADCAST_CHUNK_SIZE:
+            for connection in connections:
+                await send(connection)
+        else:
+            for i in range(0, len(connections), BROADCAST_CHUNK_SIZE):
+                await asyncio.gather(*(send(c) for c in connections[i:i + BROADCAST_CHUNK_SIZE]))
+                # Yield so other tasks can run between chunks
+                await asyncio.sleep(0)
+
         # Clean up disconnected clients
         for connection in disconnected:
             self.disconnect(connection, job_id)
@@ -72,4 +92,29 @@ class WebSocketManager:
             }
         }
         #logger.info(f"Status: {status}, Message: {message}")
-        await self.broadcast_to_job(job_id, update)
\ No newline at end of file
+        await self.broadcast_to_job(job_id, update)
+
+    def queue_status_update(self, job_id: str, status: str, message: str = None, error: str = None, result: dict = None):
+        """Buffer a status update; deliver later with flush_status_updates."""
+        self.pending_updates.setdefault(job_id, []).append({
+            "type": "status_update",
+            "data": {
+                "status": status,
+                "message": message,
+                "error": error,
+                "result": result
+            }
+        })
+
+    async def flush_status_updates(self, job_id: str):
+        """Send all queued updates for a job in a single batched frame."""
+        updates = self.pending_updates.pop(job_id, None)
+        if not updates:
+            return
+        if len(updates) == 1:
+            await self.broadcast_to_job(job_id, updates[0])
+        else:
+            await self.broadcast_to_job(job_id, {
+                "type": "status_batch",
+                "data": {"updates": updates}
+            })
\ No newline at end of file
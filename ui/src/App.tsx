@@ -225,6 +225,15 @@ function App() {
     ws.onmessage = (event) => {
       const rawData = JSON.parse(event.data);
 
+      // A status_batch frame carries several queued status updates;
+      // replay each one through this handler in order
+      if (rawData.type === "status_batch") {
+        for (const update of rawData.data?.updates ?? []) {
+          ws.onmessage?.({ ...event, data: JSON.stringify(update) } as MessageEvent);
+        }
+        return;
+      }
+
       if (rawData.type === "status_update") {
         const statusData = rawData.data;
 
@@ -456,6 +465,24 @@ function App() {
               return prev;
             });
           }
+          // Apply a batch of kept documents in a single state update
+          else if (statusData.status === "document_kept_batch") {
+            const items = (statusData.result?.items ?? []) as { doc_type: string }[];
+            setResearchState((prev) => {
+              if (!prev.docCounts) return prev;
+              const docCounts = { ...prev.docCounts };
+              for (const item of items) {
+                const docType = item.doc_type as keyof DocCounts;
+                if (docCounts[docType]) {
+                  docCounts[docType] = {
+                    initial: docCounts[docType].initial,
+                    kept: docCounts[docType].kept + 1
+                  };
+                }
+              }
+              return { ...prev, docCounts: docCounts as DocCounts };
+            });
+          }
           // Update final doc counts when curation is complete
           else if (statusData.status === "curation_complete" && statusData.result.doc_counts) {
             setResearchState((prev) => ({